@@ -1,24 +1,60 @@
 # app.py
+import json
 import os
+import time
 import streamlit as st
 
-# Prefer Streamlit secrets in the cloud, fall back to env for local dev
+# Must be the first Streamlit command of the script
+st.set_page_config(page_title="Suumo → Airtable", page_icon="🏠", layout="centered")
+
+ENV_KEYS = (
+    "AIRTABLE_API_KEY", "BASE_ID", "TABLE_ID", "STATIONS_TABLE_ID", "LAYOUTS_TABLE_ID",
+    "PROP_TYPES_TABLE_ID", "AREAS_TABLE_ID", "PRICE_RANGE_TABLE_ID", "PROPERTY_KIND_TABLE_ID",
+    "GOOGLE_CLOUD_PROJECT", "GOOGLE_SERVICE_ACCOUNT_JSON",
+)
+
+# Prefer Streamlit secrets in the cloud, fall back to env for local dev.
+# load_if_toml_exists() checks quietly; reading st.secrets without a secrets.toml
+# would draw an error box before raising.
+_HAS_SECRETS = st.secrets.load_if_toml_exists()
+
 def _get(k, default=""):
-    if "secrets" in st.runtime.scriptrunner.get_script_run_ctx().session_data:  # st.secrets available
+    if _HAS_SECRETS:
         return st.secrets.get(k, os.getenv(k, default))
     return os.getenv(k, default)
 
+# The scraper reads its config from the environment at import time
+for _k in ENV_KEYS:
+    _v = _get(_k)
+    if _v:
+        os.environ[_k] = str(_v)
+
+# Streamlit Cloud: a [gcp_service_account] table in secrets (the key file's fields)
+if _HAS_SECRETS and "gcp_service_account" in st.secrets:
+    os.environ["GOOGLE_SERVICE_ACCOUNT_JSON"] = json.dumps(dict(st.secrets["gcp_service_account"]))
+
 # Import your scraper
-from suumo_scraper import get_suumo_data, upload_to_airtable
+from suumo_scraper import get_suumo_data, upload_to_airtable, upload_many_to_airtable
 
-st.set_page_config(page_title="Suumo → Airtable", page_icon="🏠", layout="centered")
+UPLOAD_COOLDOWN_S = 30  # refuse uploading the same URL again within this window
+SCRAPE_TTL_S = 3600     # a scrape older than this is fetched again
+AIRTABLE_BATCH = 10     # records per Airtable create request
+
+MODE_PREVIEW = "Preview only"
+MODE_UPLOAD = "Upload to Airtable now"
+MODE_QUEUE = "Add to upload queue (send several properties in one batch)"
+
+# Widget interactions rerun the whole script; only re-scrape when the URL changes
+@st.cache_data(ttl=SCRAPE_TTL_S, show_spinner=False)
+def _cached_scrape(u: str) -> dict:
+    return get_suumo_data(u)
 
 st.title("Suumo → Airtable uploader")
 st.caption("Paste a Suumo property URL, preview parsed data, then upload to Airtable.")
 
 with st.form("scrape"):
     url = st.text_input("Suumo URL", placeholder="https://suumo.jp/chintai/…")
-    do_upload = st.checkbox("Upload to Airtable after preview", value=False)
+    mode = st.radio("After preview", (MODE_PREVIEW, MODE_UPLOAD, MODE_QUEUE))
     submitted = st.form_submit_button("Run")
 
 if submitted:
@@ -26,25 +62,73 @@ if submitted:
         st.error("Please paste a URL.")
         st.stop()
 
-    try:
-        data = get_suumo_data(url)
-    except Exception as e:
-        st.exception(e)
-        st.stop()
+    url = url.strip()
+    # Resubmitting the same URL in this session reuses the last result while it is fresh
+    last_ts = st.session_state.get("last_data_ts")
+    if (st.session_state.get("last_url") == url and "last_data" in st.session_state
+            and last_ts is not None and time.monotonic() - last_ts < SCRAPE_TTL_S):
+        data = st.session_state["last_data"]
+    else:
+        try:
+            data = _cached_scrape(url)
+        except Exception as e:
+            st.exception(e)
+            st.stop()
+        st.session_state["last_url"] = url
+        st.session_state["last_data"] = data
+        st.session_state["last_data_ts"] = time.monotonic()
 
     st.subheader("Preview")
     st.json(data, expanded=False)
 
-    if do_upload:
+    if mode == MODE_QUEUE:
+        # Keyed by URL so resubmitting a property never queues a second copy
+        queue = st.session_state.setdefault("queue", {})
+        if url in queue:
+            st.info("Already in the upload queue.")
+        else:
+            queue[url] = data
+            st.info("Added to the upload queue.")
+    elif mode == MODE_UPLOAD:
+        now = time.monotonic()
+        last_ts = st.session_state.get("last_upload_ts")
+        if (st.session_state.get("last_upload_url") == url
+                and last_ts is not None and now - last_ts < UPLOAD_COOLDOWN_S):
+            st.warning("This URL was just uploaded; skipping to avoid a duplicate row.")
+        else:
+            try:
+                res = upload_to_airtable(data)  # returns created record or prints success
+                st.session_state["last_upload_url"] = url
+                st.session_state["last_upload_ts"] = now
+                st.success("Uploaded to Airtable ✅")
+                if isinstance(res, dict):
+                    st.json(res)
+            except Exception as e:
+                st.error("Upload failed.")
+                st.exception(e)
+
+queue = st.session_state.get("queue", {})
+if queue:
+    st.subheader(f"Upload queue ({len(queue)})")
+    col_upload, col_clear = st.columns(2)
+    if col_upload.button("Upload queued to Airtable"):
+        # One request per chunk; drop each chunk from the queue as soon as it is
+        # created, so a failure part-way leaves only the unsent records for a retry.
+        uploaded = 0
+        urls = list(queue)
         try:
-            res = upload_to_airtable(data)  # returns created record or prints success
-            st.success("Uploaded to Airtable ✅")
-            if isinstance(res, dict):
-                st.json(res)
+            for i in range(0, len(urls), AIRTABLE_BATCH):
+                chunk = urls[i:i + AIRTABLE_BATCH]
+                uploaded += len(upload_many_to_airtable([queue[u] for u in chunk]))
+                for u in chunk:
+                    del queue[u]
+            st.success(f"Uploaded {uploaded} records to Airtable ✅")
         except Exception as e:
-            st.error("Upload failed.")
+            st.error(f"Upload failed after {uploaded} records; {len(queue)} remain queued.")
             st.exception(e)
+    if col_clear.button("Clear queue"):
+        st.session_state["queue"] = {}
+        st.rerun()
 
 st.divider()
-st.caption("Env keys used: AIRTABLE_API_KEY, BASE_ID, TABLE_ID, STATIONS_TABLE_ID, "
-           "LAYOUTS_TABLE_ID, PROP_TYPES_TABLE_ID, AREAS_TABLE_ID, PRICE_RANGE_TABLE_ID, PROPERTY_KIND_TABLE_ID")
+st.caption("Env keys used: " + ", ".join(ENV_KEYS))
@@ -1,3 +1,4 @@
+import json
 from getpass import getpass
 from pathlib import Path
 import textwrap
@@ -15,6 +16,13 @@ AREAS_TABLE_ID = input("AREAS_TABLE_ID: ").strip()
 PRICE_RANGE_TABLE_ID = input("PRICE_RANGE_TABLE_ID: ").strip()
 PROPERTY_KIND_TABLE_ID = input("PROPERTY_KIND_TABLE_ID: ").strip()
 
+print("\n--- Google Cloud Translation (service account key) ---")
+SA_PATH = input("Path to service account key JSON: ").strip()
+SA_INFO = json.loads(Path(SA_PATH).expanduser().read_text(encoding="utf-8")) if SA_PATH else {}
+GOOGLE_CLOUD_PROJECT = input(f"GOOGLE_CLOUD_PROJECT [{SA_INFO.get('project_id', '')}]: ").strip() \
+    or SA_INFO.get("project_id", "")
+SA_JSON = json.dumps(SA_INFO, separators=(",", ":")) if SA_INFO else ""
+
 env_text = f"""AIRTABLE_API_KEY={AIRTABLE_API_KEY}
 BASE_ID={BASE_ID}
 TABLE_ID={TABLE_ID}
@@ -25,6 +33,9 @@ PROP_TYPES_TABLE_ID={PROP_TYPES_TABLE_ID}
 AREAS_TABLE_ID={AREAS_TABLE_ID}
 PRICE_RANGE_TABLE_ID={PRICE_RANGE_TABLE_ID}
 PROPERTY_KIND_TABLE_ID={PROPERTY_KIND_TABLE_ID}
+
+GOOGLE_CLOUD_PROJECT={GOOGLE_CLOUD_PROJECT}
+GOOGLE_SERVICE_ACCOUNT_JSON='{SA_JSON}'
 """
 
 Path(".env").write_text(env_text, encoding="utf-8")
@@ -40,6 +51,12 @@ PROP_TYPES_TABLE_ID = "{PROP_TYPES_TABLE_ID}"
 AREAS_TABLE_ID = "{AREAS_TABLE_ID}"
 PRICE_RANGE_TABLE_ID = "{PRICE_RANGE_TABLE_ID}"
 PROPERTY_KIND_TABLE_ID = "{PROPERTY_KIND_TABLE_ID}"
+GOOGLE_CLOUD_PROJECT = "{GOOGLE_CLOUD_PROJECT}"
 """)
+if SA_INFO:
+    # TOML table after the top-level keys; JSON string escapes are valid TOML basic strings
+    secrets_block += "\n[gcp_service_account]\n" + "".join(
+        f"{k} = {json.dumps(v)}\n" for k, v in SA_INFO.items()
+    )
 print("\n🔐 Streamlit → (Your app) → Settings → Secrets — paste this:\n")
 print(secrets_block)
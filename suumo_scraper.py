@@ -4,12 +4,23 @@ from __future__ import annotations
 import os
 import re
 import json
-from typing import Optional, List, Tuple
-
-import requests
-from bs4 import BeautifulSoup
-from googletrans import Translator
-from pyairtable import Table, Api
+import logging
+import pickle
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Iterator, Optional, List, Tuple
+
+import httpx
+from lxml import etree
+from lxml.html import HTMLParser, HtmlElement
+from diskcache import Cache
+from google.api_core.exceptions import GoogleAPIError
+from google.cloud import translate_v3 as translate
+import pykakasi
+from pyairtable import Api, retry_strategy
+from pyairtable.formulas import match
 from dotenv import load_dotenv
 
 # --------------------------------------------------------------------------------------
@@ -29,8 +40,32 @@ AREAS_TABLE_ID = os.getenv("AREAS_TABLE_ID", "")                # Property Locat
 PRICE_RANGE_TABLE_ID = os.getenv("PRICE_RANGE_TABLE_ID", "")    # Price ranges (Name)
 PROPERTY_KIND_TABLE_ID = os.getenv("PROPERTY_KIND_TABLE_ID", "")# For Rent / For Buy (Name)
 
+# Google Cloud Translation v3. Credentials: service-account key JSON (the app copies
+# it from st.secrets), else Application Default Credentials (GOOGLE_APPLICATION_CREDENTIALS).
+GOOGLE_CLOUD_PROJECT = os.getenv("GOOGLE_CLOUD_PROJECT", "")
+GOOGLE_SERVICE_ACCOUNT_JSON = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "")
+
 HEADERS = {"User-Agent": "Mozilla/5.0"}
 
+logger = logging.getLogger(__name__)
+
+# Precompiled patterns for the parsing pass
+_RE_SPACE = re.compile(r"\s+")
+_RE_MAN = re.compile(r"([\d.]+)")                          # 16.4万円
+_RE_YEN = re.compile(r"([\d]+)")                           # 10000円
+_RE_NUM_ONLY = re.compile(r"[^\d.]")
+_RE_MINUTES = re.compile(r"(?:歩|徒歩)\s*(\d+)\s*分")
+_RE_WALK_TAIL = re.compile(r"(?:歩|徒歩)\s*\d+\s*分.*")
+_RE_WARD = re.compile(r"(?P<ward>.+?)区(?P<rest>.*)")
+_RE_LONG_VOWEL = re.compile(r"o{2,}|ou|uu")                   # koutou -> koto, jiyuu -> jiyu
+_RE_NAME_KEY_STRIP = re.compile(r"[-\s']")                    # 'Yoyogi-Uehara' ~ 'yoyogiuehara'
+
+# On-disk caches survive Streamlit sessions and container restarts
+CACHE_DIR = ".cache"
+TRANSLATION_TTL = 14 * 86400    # seconds
+MASTER_INDEX_TTL = 3600         # seconds; master tables listed longer ago are re-fetched
+MASTER_INDEX_MISS_REFRESH = 60  # seconds; on a lookup miss, re-list a table older than this
+
 # Curated station/area aliases to avoid awkward machine translations
 STATION_ALIASES = {
     "駒沢大学": "Komazawa-Daigaku",
@@ -59,23 +94,130 @@ AREA_ALIASES = {
     "足立": "Adachi",
     "葛飾": "Katsushika",
     "江戸川": "Edogawa",
+    "江東": "Koto",
+    "墨田": "Sumida",
 }
 
-translator = Translator()
+# Local romanizer for proper nouns (stations, wards): no network round-trip
+_kks = pykakasi.kakasi()
+
+# Shared HTTP/2 client: keep-alive + header compression so repeat scrapes reuse the suumo.jp connection
+# (retries cover connection failures; limits live on the transport when one is passed)
+_client = httpx.Client(
+    headers=HEADERS,
+    timeout=30,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_keepalive_connections=8),
+    ),
+)
+
+# Shared Airtable client (reuses its own requests.Session across calls). Only 429 is
+# retried (every method, POST included): Airtable rejects it before processing, so a
+# replay is safe, whereas a 5xx may arrive after a create was committed and a retry
+# would insert the row twice. requests' default pool of 10 covers the 8 lookup threads.
+_API = Api(
+    AIRTABLE_API_KEY,
+    timeout=(5, 30),
+    retry_strategy=retry_strategy(status_forcelist=(429,), backoff_factor=0.5),
+)
+_MAIN_TABLE = _API.table(BASE_ID, TABLE_ID)
 
 # --------------------------------------------------------------------------------------
 # Helpers
 # --------------------------------------------------------------------------------------
+# translate_text accepts at most 1024 strings per request
+_TRANSLATE_MAX_CONTENTS = 1024
+
+@lru_cache(maxsize=1)
+def _translate_client() -> Tuple[translate.TranslationServiceClient, str]:
+    """
+    (client, parent) for translate_text. Built lazily so importing this module never
+    needs Google credentials; the client keeps one gRPC channel open for later calls.
+    Misconfiguration raises (and is not cached) rather than silently skipping translation.
+    """
+    if GOOGLE_SERVICE_ACCOUNT_JSON:
+        info = json.loads(GOOGLE_SERVICE_ACCOUNT_JSON)
+        client = translate.TranslationServiceClient.from_service_account_info(info)
+        project = GOOGLE_CLOUD_PROJECT or info.get("project_id", "")
+    else:
+        client = translate.TranslationServiceClient()  # ADC; raises DefaultCredentialsError
+        project = GOOGLE_CLOUD_PROJECT
+    if not project:
+        raise RuntimeError(
+            "Google Cloud Translation is not configured: set GOOGLE_CLOUD_PROJECT "
+            "or provide a service account with a project_id."
+        )
+    return client, f"projects/{project}/locations/global"
+
+# JA -> EN memo shared by every scrape and persisted on disk; wards/stations repeat constantly
+_tcache = Cache(os.path.join(CACHE_DIR, "translate"))
+
+def batch_translate(items: List[str], src="ja", dest="en") -> List[str]:
+    """
+    Translate many strings with a single request; cached items are not re-sent.
+    Missing credentials/project raise. If the API call itself fails, the failure is
+    logged and the originals are returned, like safe_translate.
+    """
+    done: Dict[str, str] = {}
+    pending: List[str] = []
+    for t in dict.fromkeys(t for t in items if t):
+        hit = _tcache.get((src, dest, t))
+        if hit is None:
+            pending.append(t)
+        else:
+            done[t] = hit
+    for i in range(0, len(pending), _TRANSLATE_MAX_CONTENTS):
+        chunk = pending[i:i + _TRANSLATE_MAX_CONTENTS]
+        client, parent = _translate_client()
+        try:
+            resp = client.translate_text(
+                request={
+                    "parent": parent,
+                    "contents": chunk,
+                    "mime_type": "text/plain",
+                    "source_language_code": src,
+                    "target_language_code": dest,
+                }
+            )
+        except GoogleAPIError:
+            logger.warning("Translation failed for %d strings; keeping Japanese text", len(chunk), exc_info=True)
+            continue
+        for ja, tr in zip(chunk, resp.translations):
+            done[ja] = tr.translated_text
+            _tcache.set((src, dest, ja), tr.translated_text, expire=TRANSLATION_TTL)
+    return [done.get(t, t) if t else t for t in items]
+
 def safe_translate(text: str, src="ja", dest="en") -> str:
     if not text:
         return text
-    try:
-        return translator.translate(text, src=src, dest=dest).text
-    except Exception:
-        return text
+    return batch_translate([text], src=src, dest=dest)[0]
 
 def normalize_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", s or "").strip()
+    return _RE_SPACE.sub(" ", s or "").strip()
+
+def _shorten_long_vowel(m: re.Match) -> str:
+    run = m.group(0)
+    # 'ooo' is a long vowel followed by a new syllable (大岡山 oookayama -> Ookayama)
+    return "oo" if run.startswith("ooo") else run[0]
+
+def romaji(jp: str) -> str:
+    """
+    駒沢大学 -> 'Komazawa-Daigaku': Hepburn per word, capitalized, hyphen-joined.
+    Long vowels are dropped the way station signs spell them (表参道 -> 'Omotesando').
+    Readings and word splits are guesses, so use the result as a lookup key only.
+    """
+    return "-".join(
+        _RE_LONG_VOWEL.sub(_shorten_long_vowel, item["hepburn"].replace("'", "")).capitalize()
+        for item in _kks.convert(jp) if item["hepburn"]
+    )
+
+def _name_key(name: str) -> str:
+    """Index key: casefolded, without hyphens/spaces/apostrophes, so spellings that
+    differ only in word splitting ('Yoyogiuehara' vs 'Yoyogi-Uehara') match."""
+    return _RE_NAME_KEY_STRIP.sub("", name).casefold()
 
 def normalize_station_en(name_en: str) -> str:
     """Title case, remove trailing 'Station', then replace spaces with hyphens."""
@@ -83,21 +225,100 @@ def normalize_station_en(name_en: str) -> str:
     base = base.replace(" Station", "")
     return base.replace(" ", "-")
 
+# Master tables are small and rarely change: load each one in a single paginated
+# list call and answer lookups from memory, re-listing once it is MASTER_INDEX_TTL old.
+_MASTER_INDEX: Dict[str, Dict[str, str]] = {}
+_MASTER_FETCHED: Dict[str, float] = {}  # table_id -> time.time() of the last full list
+_INDEX_LOCKS: Dict[str, threading.Lock] = {}
+_INDEX_PATH = os.path.join(CACHE_DIR, "airtable_index.pkl")
+_INDEX_FILE_LOCK = threading.Lock()
+_INDEX_FORMAT = 2  # bump when the key scheme changes; older snapshots are ignored
+
+def _load_index_file() -> None:
+    """Seed _MASTER_INDEX from the on-disk snapshot: only tables listed recently, for this base."""
+    try:
+        with open(_INDEX_PATH, "rb") as f:
+            saved = pickle.load(f)
+    except (OSError, EOFError, pickle.PickleError):
+        return
+    if saved.get("base") != BASE_ID or saved.get("format") != _INDEX_FORMAT:
+        return
+    fetched = saved.get("fetched", {})
+    for table_id, names in saved.get("tables", {}).items():
+        ts = fetched.get(table_id, 0.0)
+        if time.time() - ts <= MASTER_INDEX_TTL:
+            _MASTER_INDEX.setdefault(table_id, names)
+            _MASTER_FETCHED.setdefault(table_id, ts)
+
+def _save_index_file() -> None:
+    snapshot = {
+        "base": BASE_ID,
+        "format": _INDEX_FORMAT,
+        "tables": {k: dict(v) for k, v in list(_MASTER_INDEX.items())},
+        "fetched": dict(_MASTER_FETCHED),
+    }
+    with _INDEX_FILE_LOCK:
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp = _INDEX_PATH + ".tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(snapshot, f)
+            os.replace(tmp, _INDEX_PATH)
+        except OSError:
+            pass  # cache is best-effort
+
+def _is_stale(table_id: str, max_age: float) -> bool:
+    fetched = _MASTER_FETCHED.get(table_id)
+    return fetched is None or time.time() - fetched > max_age
+
+def _index(api: Api, table_id: str, max_age: float = MASTER_INDEX_TTL) -> Dict[str, str]:
+    if _is_stale(table_id, max_age):
+        # Per-table lock: concurrent lookups list each table once, different tables in parallel
+        with _INDEX_LOCKS.setdefault(table_id, threading.Lock()):
+            if _is_stale(table_id, max_age):
+                rows = api.table(BASE_ID, table_id).all(fields=["Name"])
+                _MASTER_INDEX[table_id] = {_name_key(r["fields"].get("Name", "")): r["id"] for r in rows}
+                _MASTER_FETCHED[table_id] = time.time()
+                _save_index_file()
+    return _MASTER_INDEX[table_id]
+
+_load_index_file()
+
+# Master tables answered purely from _MASTER_INDEX; these never issue a formula query
+_PRELOADED_TABLES = frozenset(
+    t for t in (
+        STATIONS_TABLE_ID, LAYOUTS_TABLE_ID, PROP_TYPES_TABLE_ID,
+        AREAS_TABLE_ID, PRICE_RANGE_TABLE_ID, PROPERTY_KIND_TABLE_ID,
+    ) if t
+)
+
 def airtable_find_by_name(api: Api, table_id: str, name: str) -> Optional[str]:
     if not name:
         return None
-    tbl = api.table(BASE_ID, table_id)
-    # Escape single quotes for Airtable formula
-    formula = "{Name}='%s'" % name.replace("'", "\\'")
-    found = tbl.all(formula=formula)
-    return found[0]["id"] if found else None
+    if table_id in _PRELOADED_TABLES:
+        key = _name_key(name)
+        rec_id = _index(api, table_id).get(key)
+        if rec_id is None:
+            # Row may have been added in Airtable since the last list: re-list, at most
+            # once per MASTER_INDEX_MISS_REFRESH so a name that never exists stays cheap
+            rec_id = _index(api, table_id, max_age=MASTER_INDEX_MISS_REFRESH).get(key)
+        return rec_id
+    # Any other table: pyairtable builds (and escapes) the formula for us
+    rec = api.table(BASE_ID, table_id).first(formula=match({"Name": name}))
+    return rec["id"] if rec else None
 
 def airtable_get_or_create_by_name(api: Api, table_id: str, name: str) -> Optional[str]:
     rec_id = airtable_find_by_name(api, table_id, name)
     if rec_id:
         return rec_id
-    created = api.table(BASE_ID, table_id).create({"Name": name})
-    return created["id"]
+    # Server-side upsert on Name: one round trip, and a row created concurrently
+    # elsewhere is matched instead of duplicated
+    result = api.table(BASE_ID, table_id).batch_upsert([{"fields": {"Name": name}}], key_fields=["Name"])
+    rec_id = result["records"][0]["id"]
+    if table_id in _PRELOADED_TABLES:
+        _index(api, table_id)[_name_key(name)] = rec_id
+        _save_index_file()
+    return rec_id
 
 def parse_price(text: str) -> str:
     """
@@ -108,22 +329,25 @@ def parse_price(text: str) -> str:
         return "0"
     t = text.replace(",", "")
     if "万" in t:
-        m = re.search(r"([\d.]+)", t)
+        m = _RE_MAN.search(t)
         if not m:
             return "0"
         value = int(float(m.group(1)) * 10000)
         return f"{value:,}"
     # plain 円
-    m = re.search(r"([\d]+)", t)
+    m = _RE_YEN.search(t)
     if m:
         return f"{int(m.group(1)):,}"
     return "0"
 
 def parse_minutes(fragment: str) -> Optional[int]:
     # match 歩3分 / 徒歩12分 etc.
-    m = re.search(r"(?:歩|徒歩)\s*(\d+)\s*分", fragment)
+    m = _RE_MINUTES.search(fragment)
     return int(m.group(1)) if m else None
 
+# ¥100~199K … ¥900~999K, then ¥1M~ (index = hundreds of thousands above 100K)
+_PRICE_RANGE_LABELS = tuple(f"¥{100 * i}~{100 * i + 99}K" for i in range(1, 10)) + ("¥1M~",)
+
 def price_range_label(rent_int: int) -> str:
     """
     Map monthly rent to your price-range labels.
@@ -131,28 +355,10 @@ def price_range_label(rent_int: int) -> str:
     """
     # Safety
     if rent_int <= 0:
-        return "¥100~199K"  # fallback bucket; adjust to your liking
+        return _PRICE_RANGE_LABELS[0]  # fallback bucket; adjust to your liking
 
     k = rent_int // 1000  # thousands (e.g., 360000 -> 360)
-    if k < 200:
-        return "¥100~199K"
-    if 200 <= k <= 299:
-        return "¥200~299K"
-    if 300 <= k <= 399:
-        return "¥300~399K"
-    if 400 <= k <= 499:
-        return "¥400~499K"
-    if 500 <= k <= 599:
-        return "¥500~599K"
-    if 600 <= k <= 699:
-        return "¥600~699K"
-    if 700 <= k <= 799:
-        return "¥700~799K"
-    if 800 <= k <= 899:
-        return "¥800~899K"
-    if 900 <= k <= 999:
-        return "¥900~999K"
-    return "¥1M~"
+    return _PRICE_RANGE_LABELS[min(max((k - 100) // 100, 0), len(_PRICE_RANGE_LABELS) - 1)]
 
 def map_property_category_jp_to_en(jp: str) -> Optional[str]:
     mapping = {
@@ -186,43 +392,41 @@ def get_layout_record_id(api: Api, layout_name_jp: str) -> Optional[str]:
 
 def get_or_create_station_id(api: Api, station_ja_or_en: str) -> Optional[str]:
     """
-    Translate station name if JA, normalize to your canonical 'Minami-Shinjuku' style,
-    then get/create in Stations table by Name.
+    Curated alias, or an existing row found by the romanized name; otherwise
+    translate + normalize to your canonical 'Minami-Shinjuku' style and get/create.
+    Romaji alone never creates a row: a misreading would become a permanent station.
     """
     if not station_ja_or_en:
         return None
 
     # curated alias first
     if station_ja_or_en in STATION_ALIASES:
-        norm = STATION_ALIASES[station_ja_or_en]
-    else:
-        en = safe_translate(station_ja_or_en, src="ja", dest="en")
-        norm = normalize_station_en(en)
+        return airtable_get_or_create_by_name(api, STATIONS_TABLE_ID, STATION_ALIASES[station_ja_or_en])
+    if station_ja_or_en.isascii():
+        return airtable_get_or_create_by_name(api, STATIONS_TABLE_ID, normalize_station_en(station_ja_or_en))
 
-    # Try exact
-    rec = airtable_find_by_name(api, STATIONS_TABLE_ID, norm)
+    # Local romaji: lookup only (the index ignores hyphens/spaces/case)
+    rec = airtable_find_by_name(api, STATIONS_TABLE_ID, romaji(station_ja_or_en))
     if rec:
         return rec
 
-    # Also try alt forms (spaces vs hyphens)
-    alt = norm.replace("-", " ")
-    rec_alt = airtable_find_by_name(api, STATIONS_TABLE_ID, alt)
-    if rec_alt:
-        return rec_alt
-
-    # Not found -> create normalized
-    return airtable_get_or_create_by_name(api, STATIONS_TABLE_ID, norm)
+    # Not found -> translated, normalized name
+    en = safe_translate(station_ja_or_en, src="ja", dest="en")
+    return airtable_get_or_create_by_name(api, STATIONS_TABLE_ID, normalize_station_en(en))
 
 def get_or_create_area_id(api: Api, ward_jp: str) -> Optional[str]:
     """
     Ward area (e.g., 世田谷) → English (Setagaya) with alias mapping, then link/create.
+    Unaliased wards are matched by romaji first, and only created from the translation.
     """
     if not ward_jp:
         return None
     if ward_jp in AREA_ALIASES:
-        en = AREA_ALIASES[ward_jp]
-    else:
-        en = safe_translate(ward_jp, src="ja", dest="en").title()
+        return airtable_get_or_create_by_name(api, AREAS_TABLE_ID, AREA_ALIASES[ward_jp])
+    rec = airtable_find_by_name(api, AREAS_TABLE_ID, romaji(ward_jp))
+    if rec:
+        return rec
+    en = safe_translate(ward_jp, src="ja", dest="en").title()
     return airtable_get_or_create_by_name(api, AREAS_TABLE_ID, en)
 
 def get_property_category_id(api: Api, type_en: str) -> Optional[str]:
@@ -243,64 +447,98 @@ def get_price_range_id(api: Api, label: str) -> Optional[str]:
 # --------------------------------------------------------------------------------------
 # SUUMO parsing helpers
 # --------------------------------------------------------------------------------------
-def extract_name(soup: BeautifulSoup) -> str:
-    tag = soup.select_one("h1.section_h1-header-title")
-    ja = tag.get_text(strip=True) if tag else ""
-    return safe_translate(ja, src="ja", dest="en") if ja else "N/A"
+def _cls(name: str) -> str:
+    """XPath predicate equivalent to the CSS class selector '.name'."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+def _text(el: HtmlElement) -> str:
+    """Stripped text pieces joined together (BeautifulSoup's get_text(strip=True))."""
+    return "".join(t.strip() for t in el.itertext())
 
-def extract_rent_and_fee(soup: BeautifulSoup) -> Tuple[str, str]:
+def fetch_tree(url: str) -> HtmlElement:
+    """
+    Stream the page into lxml's incremental parser chunk by chunk, so parsing
+    overlaps the download and the raw HTML is never held in memory as a whole.
+    """
+    with _client.stream("GET", url) as resp:
+        resp.raise_for_status()
+        parser = HTMLParser(encoding=resp.charset_encoding)
+        for chunk in resp.iter_bytes(64 * 1024):
+            parser.feed(chunk)
+        return parser.close()
+
+# Compiled once; evaluated entirely inside libxml2. Labels are passed as XPath
+# variables, so no quoting/escaping of the Japanese text is needed.
+_XP_TD_AFTER = etree.XPath("//th[contains(., $label)]/following-sibling::td[1]")
+_XP_NAME = etree.XPath(f"//h1[{_cls('section_h1-header-title')}]")
+_XP_RENT = etree.XPath(f"//span[{_cls('property_view_note-emphasis')}]")
+_XP_NOTE_SPANS = etree.XPath(f"//div[{_cls('property_view_note-list')}]//span")
+_XP_STATION_READS = etree.XPath(f".//div[{_cls('property_view_table-read')}]")
+# data-src if present, else src (lazy-loaded gallery images)
+_XP_GALLERY_SRCS = etree.XPath(
+    "//ul[@id='js-view_gallery-list']//img/@data-src[normalize-space()]"
+    " | //ul[@id='js-view_gallery-list']//img[not(normalize-space(@data-src))]/@src"
+)
+
+def _td_after(tree: HtmlElement, label: str) -> Optional[HtmlElement]:
+    """The td right after the first th containing label (headers often carry extra text)."""
+    els = _XP_TD_AFTER(tree, label=label)
+    return els[0] if els else None
+
+def extract_name_jp(tree: HtmlElement) -> str:
+    tags = _XP_NAME(tree)
+    return _text(tags[0]) if tags else ""
+
+def extract_rent_and_fees(tree: HtmlElement) -> Tuple[str, str, str, str]:
+    """
+    Return (rent, management_fee, deposit, key_money), reading the note spans once.
+    """
     # Rent
-    rent_tag = soup.select_one("span.property_view_note-emphasis")
-    rent = parse_price(rent_tag.get_text(strip=True)) if rent_tag else "0"
-
-    # Management fee
-    mgmt = "0"
-    for sp in soup.select("div.property_view_note-info > div.property_view_note-list > span"):
-        if "管理費" in sp.get_text() or "共益費" in sp.get_text():
-            mgmt = parse_price(sp.get_text(strip=True))
-            break
-    return rent, mgmt
+    rent_tags = _XP_RENT(tree)
+    rent = parse_price(_text(rent_tags[0])) if rent_tags else "0"
+
+    mgmt: Optional[str] = None
+    deposit = key_money = "0"
+    for sp in _XP_NOTE_SPANS(tree):
+        t = _text(sp)
+        if mgmt is None and ("管理費" in t or "共益費" in t):
+            mgmt = parse_price(t)
+        if "敷金" in t:
+            deposit = parse_price(t)
+        elif "礼金" in t:
+            key_money = parse_price(t)
+    return rent, mgmt or "0", deposit, key_money
 
-def extract_layout_and_size(soup: BeautifulSoup) -> Tuple[str, str]:
+def extract_layout_and_size(tree: HtmlElement) -> Tuple[str, str]:
     layout = "N/A"
     size = "N/A"
 
-    row_l = soup.find("th", string=lambda t: t and "間取り" in t)
-    if row_l:
-        td = row_l.find_next("td")
-        if td:
-            layout = td.get_text(strip=True)
-
-    row_s = soup.find("th", string=lambda t: t and "専有面積" in t)
-    if row_s:
-        td = row_s.find_next("td")
-        if td:
-            raw = td.get_text(strip=True)
-            num = re.sub(r"[^\d.]", "", raw)
-            if num:
-                size = str(round(float(num)))
+    td = _td_after(tree, "間取り")
+    if td is not None:
+        layout = _text(td)
+
+    td = _td_after(tree, "専有面積")
+    if td is not None:
+        raw = _text(td)
+        num = _RE_NUM_ONLY.sub("", raw)
+        if num:
+            size = str(round(float(num)))
 
     return layout, size
 
-def extract_property_category_jp(soup: BeautifulSoup) -> Optional[str]:
-    row = soup.find("th", string=lambda t: t and "建物種別" in t)
-    if not row:
-        return None
-    td = row.find_next("td")
-    return td.get_text(strip=True) if td else None
-
-def extract_address_jp(soup: BeautifulSoup) -> Optional[str]:
-    for tr in soup.select("table.property_view_table tr"):
-        th = tr.find("th")
-        td = tr.find("td")
-        if th and "所在地" in th.get_text(strip=True):
-            return td.get_text(strip=True)
-    return None
+def extract_property_category_jp(tree: HtmlElement) -> Optional[str]:
+    td = _td_after(tree, "建物種別")
+    return _text(td) if td is not None else None
+
+def extract_address_jp(tree: HtmlElement) -> Optional[str]:
+    td = _td_after(tree, "所在地")
+    return _text(td) if td is not None else None
 
 def split_address_to_area_and_street(address_jp: str) -> Tuple[Optional[str], Optional[str]]:
     """
     東京都世田谷区玉堤２ -> ward='世田谷', street='玉堤２'
     Remove '東京都' and the '区' suffix from ward for linking.
+    Both parts stay Japanese; get_suumo_data translates them in one batch.
     """
     if not address_jp:
         return None, None
@@ -308,33 +546,27 @@ def split_address_to_area_and_street(address_jp: str) -> Tuple[Optional[str], Op
     t = address_jp
     t = t.replace("東京都", "", 1)
 
-    m = re.match(r"(?P<ward>.+?)区(?P<rest>.*)", t)
+    m = _RE_WARD.match(t)
     if not m:
         # fallback: try 市 etc., translate entire thing as street
         return None, address_jp
 
     ward = m.group("ward").strip()
     rest = m.group("rest").strip()
-    # street english:
-    street_en = safe_translate(rest, src="ja", dest="en")
-    street_en = normalize_spaces(street_en)
-    return ward, street_en
+    return ward, rest
 
-def extract_stations_and_minutes(soup: BeautifulSoup) -> List[Tuple[str, Optional[int]]]:
+def extract_stations_and_minutes(tree: HtmlElement) -> List[Tuple[str, Optional[int]]]:
     """
     Return up to two: [(station_ja, minutes), ...]
-    Looks in the row where th is '駅徒歩'.
+    Looks in the row where th is '駅徒歩'. Names are cleaned but left untranslated.
     """
     items: List[Tuple[str, Optional[int]]] = []
-    row = soup.find("th", string=lambda t: t and "駅徒歩" in t)
-    if not row:
-        return items
-    td = row.find_next("td")
-    if not td:
+    td = _td_after(tree, "駅徒歩")
+    if td is None:
         return items
 
-    for div in td.select("div.property_view_table-read"):
-        raw = div.get_text(strip=True)
+    for div in _XP_STATION_READS(td):
+        raw = _text(div)
         if not raw:
             continue
 
@@ -347,104 +579,56 @@ def extract_stations_and_minutes(soup: BeautifulSoup) -> List[Tuple[str, Optiona
 
         minutes = parse_minutes(st_part)
         # remove "駅" and everything from '歩..分' onward
-        st_clean = re.sub(r"(?:歩|徒歩)\s*\d+\s*分.*", "", st_part)
+        st_clean = _RE_WALK_TAIL.sub("", st_part)
         st_clean = st_clean.replace("駅", "").strip()
         if not st_clean:
             continue
 
-        # curated alias first
-        if st_clean in STATION_ALIASES:
-            station_en = STATION_ALIASES[st_clean]
-        else:
-            station_en = safe_translate(st_clean, src="ja", dest="en")
-            station_en = normalize_station_en(station_en)
-
-        items.append((station_en, minutes))
+        items.append((st_clean, minutes))
         if len(items) >= 2:
             break
 
     return items
 
-def extract_images(soup: BeautifulSoup) -> Tuple[Optional[dict], Optional[dict], List[dict]]:
+def _iter_img_urls(tree: HtmlElement) -> Iterator[dict]:
+    """Lazily yield {"url": ...} for absolute gallery image URLs, in page order."""
+    for src in _XP_GALLERY_SRCS(tree):
+        if src.startswith("http"):
+            yield {"url": str(src)}
+
+def extract_images(tree: HtmlElement) -> Tuple[Optional[dict], Optional[dict], List[dict]]:
     """
     From full gallery list: first -> cover, second -> plan, rest -> gallery.
     Return (cover, plan, gallery_list_of_dicts)
     """
-    imgs = []
-    for img in soup.select("ul#js-view_gallery-list img"):
-        src = img.get("data-src") or img.get("src")
-        if src and src.startswith("http"):
-            imgs.append({"url": src})
-
-    cover = imgs[0] if len(imgs) > 0 else None
-    plan = imgs[1] if len(imgs) > 1 else None
-    gallery = imgs[2:] if len(imgs) > 2 else []
+    it = _iter_img_urls(tree)
+    cover = next(it, None)
+    plan = next(it, None)
+    gallery = list(it)
     return cover, plan, gallery
 
 # --------------------------------------------------------------------------------------
 # Public API
 # --------------------------------------------------------------------------------------
 def get_suumo_data(url: str) -> dict:
-    resp = requests.get(url, headers=HEADERS, timeout=30)
-    resp.raise_for_status()
-    soup = BeautifulSoup(resp.content, "html.parser")
-
-    api = Api(AIRTABLE_API_KEY)
-
-    # Name
-    name = extract_name(soup)
+    tree = fetch_tree(url)
 
-    # Rent / Fee
-    rent, mgmt = extract_rent_and_fee(soup)
+    api = _API
 
-    # Layout / Size
-    layout_jp, size = extract_layout_and_size(soup)
-    layout_id = get_layout_record_id(api, layout_jp)
-
-    # Address → area + street
-    address_jp = extract_address_jp(soup)
-    ward_jp, street_en = split_address_to_area_and_street(address_jp or "")
-    area_id = get_or_create_area_id(api, ward_jp) if ward_jp else None
-
-    # Deposit / Key money
-    deposit = key_money = "0"
-    for sp in soup.select("div.property_view_note-list span"):
-        t = sp.get_text(strip=True)
-        if "敷金" in t:
-            deposit = parse_price(t)
-        elif "礼金" in t:
-            key_money = parse_price(t)
+    # Pure parsing first (no I/O)
+    rent, mgmt, deposit, key_money = extract_rent_and_fees(tree)
+    layout_jp, size = extract_layout_and_size(tree)
+    address_jp = extract_address_jp(tree)
 
     # Images
-    cover_img, plan_img, gallery_imgs = extract_images(soup)
-
-    # Stations
-    stations = extract_stations_and_minutes(soup)  # [(station_en, minutes), ...]
-    station_ids: List[Optional[str]] = []
-    minutes_list: List[Optional[int]] = []
-    for st_en, mins in stations:
-        # st_en is already normalized (Minami-Shinjuku, etc)
-        # Try to find exact or alt; if missing, create it.
-        st_id = airtable_get_or_create_by_name(api, STATIONS_TABLE_ID, st_en)
-        station_ids.append(st_id)
-        minutes_list.append(mins if isinstance(mins, int) else None)
-
-    # pad to two
-    while len(station_ids) < 2:
-        station_ids.append(None)
-    while len(minutes_list) < 2:
-        minutes_list.append(None)
+    cover_img, plan_img, gallery_imgs = extract_images(tree)
 
     # Property category (建物種別 → Apartment/Detached house)
-    prop_cat_id = None
-    jp_kind = extract_property_category_jp(soup)
+    jp_kind = extract_property_category_jp(tree)
     en_cat = map_property_category_jp_to_en(jp_kind) if jp_kind else None
-    if en_cat:
-        prop_cat_id = get_property_category_id(api, en_cat)
 
     # Property kind (For Rent / For Buy) from URL
     kind = map_property_kind_from_url(url)
-    kind_id = get_property_kind_id(api, kind) if kind else None
 
     # Price range
     try:
@@ -452,7 +636,45 @@ def get_suumo_data(url: str) -> dict:
     except Exception:
         rent_int = 0
     pr_label = price_range_label(rent_int)
-    pr_id = get_price_range_id(api, pr_label)
+
+    # Address → area + street, stations (all still Japanese)
+    name_jp = extract_name_jp(tree)
+    ward_jp, street_jp = split_address_to_area_and_street(address_jp or "")
+    stations = extract_stations_and_minutes(tree)  # [(station_ja, minutes), ...]
+
+    # Free text goes through the translation API in one request; station and
+    # ward names are romanized locally by their get_or_create helpers.
+    name_en, street_en = batch_translate([name_jp, street_jp or ""])
+    name = name_en or "N/A"
+    street_en = normalize_spaces(street_en) if street_jp is not None else None
+
+    # Airtable lookups are independent HTTP round-trips: run them concurrently
+    # so wall time is the slowest call rather than the sum.
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        layout_f = ex.submit(get_layout_record_id, api, layout_jp)
+        cat_f = ex.submit(get_property_category_id, api, en_cat)
+        kind_f = ex.submit(get_property_kind_id, api, kind)
+        pr_f = ex.submit(get_price_range_id, api, pr_label)
+        area_f = ex.submit(get_or_create_area_id, api, ward_jp)
+        # Stations: alias or romaji (Minami-Shinjuku, etc); create if missing
+        station_fs = [ex.submit(get_or_create_station_id, api, st) for st, _ in stations]
+
+        layout_id = layout_f.result()
+        area_id = area_f.result()
+        station_ids: List[Optional[str]] = [f.result() for f in station_fs]
+        prop_cat_id = cat_f.result()
+        kind_id = kind_f.result()
+        pr_id = pr_f.result()
+
+    minutes_list: List[Optional[int]] = [
+        mins if isinstance(mins, int) else None for _, mins in stations
+    ]
+
+    # pad to two
+    while len(station_ids) < 2:
+        station_ids.append(None)
+    while len(minutes_list) < 2:
+        minutes_list.append(None)
 
     # Build record payload for preview / upload
     data = {
@@ -484,9 +706,16 @@ def get_suumo_data(url: str) -> dict:
     }
     return data
 
-def upload_to_airtable(data: dict) -> None:
+def upload_to_airtable(data: dict) -> dict:
+    """
+    Create a row in your main collection and return the created record.
+    """
+    return _MAIN_TABLE.create(data, typecast=True)
+
+def upload_many_to_airtable(rows: List[dict]) -> List[dict]:
     """
-    Create a row in your main collection.
+    Create several rows in your main collection; pyairtable sends them 10 per request.
     """
-    table = Table(AIRTABLE_API_KEY, BASE_ID, TABLE_ID)
-    table.create(data)
+    if not rows:
+        return []
+    return _MAIN_TABLE.batch_create(rows, typecast=True)